@@ -1,6 +1,7 @@
 """Examples module for users on how to create fitness functions and testing"""
 import numpy as np
 
+from gevopy import genetics
 from gevopy.fitness import FitnessModel
 
 
@@ -15,6 +16,24 @@ class MostOnes(FitnessModel):
         return phenotype.chromosome.count(1)
 
 
+# ------------------------------------------------------------------
+# Most Ones Batch --------------------------------------------------
+# Same score as MostOnes, but counting the ones of all phenotypes at
+# once on the stacked chromosomes with a single numpy operation.
+class MostOnesBatch(MostOnes):
+    """Fitness model count amount of '1' in all chromosomes at once"""
+    # pylint: disable=attribute-defined-outside-init
+
+    def setup(self, phenotypes):
+        """Set up method to run once per generation"""
+        self.executed = True
+
+    def score_batch(self, phenotypes):
+        """Method to use for evaluating all phenotypes at once"""
+        chromosomes = genetics.stack(phenotypes, "chromosome")
+        return (chromosomes == 1).sum(axis=1, dtype=float).tolist()
+
+
 # ------------------------------------------------------------------
 # Random -----------------------------------------------------------
 # This fitness object scores each phenotypes completelly random.
@@ -29,3 +48,15 @@ class Random(FitnessModel):
     def score(self, phenotype):
         """Method to use for evaluation phenotypes"""
         return np.random.random()
+
+
+# ------------------------------------------------------------------
+# Random Batch -----------------------------------------------------
+# This fitness object scores all phenotypes at once with a single
+# numpy call, which avoids one task per phenotype on the scheduler.
+class RandomBatch(Random):
+    """Fitness model assigns random scores between 0-1 in batch"""
+
+    def score_batch(self, phenotypes):
+        """Method to use for evaluating all phenotypes at once"""
+        return np.random.random(len(phenotypes))
@@ -4,6 +4,8 @@ Note that the example names are not really matching with the reality as it
 might be impossible to fully represent biological genotypes. However they
 might serve well for ilustration purposes.
 """
+from typing import List
+
 from gevopy import random
 from gevopy.genetics import Field, GenotypeModel, Haploid, Diploid
 
@@ -28,3 +30,15 @@ class Bacteria(GenotypeModel):
 class JackJumper(GenotypeModel):
     """This anst are known to have a single pair of chromosomes"""
     chromosome: Diploid = Field(default_factory=lambda: random.diploid(12))
+
+
+# ------------------------------------------------------------------
+# Eucaryote --------------------------------------------------------
+# Chromosomes can also be grouped in lists, even nested ones. In this
+# example the phenotype has 2 sets with 2 haploid chromosomes each.
+# See https://pydantic-docs.helpmanual.io/usage/models/
+class Eucaryote(GenotypeModel):
+    """Genotype with nested sets of haploid chromosomes"""
+    chromosomes: List[List[Haploid]] = Field(default_factory=lambda: [
+        [random.haploid(12) for _ in range(2)] for _ in range(2)
+    ])
@@ -61,10 +61,12 @@ class Algorithm(BaseModel, ABC):
 
     def __call__(self, population):
         """Executes the algorithm to return a population offspring.
-        :param population: List of phenotypes
+        :param population: List or Pool (already sorted) of phenotypes
         :returns: A list of varied phenotypes
         """
-        return self.run_cycle(tools.Pool(population))
+        if not isinstance(population, tools.Pool):
+            population = tools.Pool(population)
+        return self.run_cycle(population)
 
     @abstractmethod
     def run_cycle(self, phenotypes):
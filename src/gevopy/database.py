@@ -140,7 +140,7 @@ class Neo4jInterface(Interface):
         :return: List of ids from the created phenotypes
         """
         phenotypes = list(phenotypes)
-        cls.logger.debug('Adding phenotypes %s', phenotypes)
+        cls.logger.debug('Adding %d phenotypes', len(phenotypes))
         return container.session.execute_write(add_phenotypes, phenotypes)
 
     @classmethod
@@ -151,7 +151,7 @@ class Neo4jInterface(Interface):
         :return: Serialized phenotypes matching the input ids
         """
         ids = list(str(id) for id in ids)
-        cls.logger.debug('Getting phenotypes %s', ids)
+        cls.logger.debug('Getting %d phenotypes', len(ids))
         return container.session.execute_read(get_phenotypes, ids)
 
     @classmethod
@@ -162,7 +162,7 @@ class Neo4jInterface(Interface):
         :return: Deleted phenotypes matching the input ids
         """
         ids = list(str(id) for id in ids)
-        cls.logger.debug('Deleting phenotypes %s', ids)
+        cls.logger.debug('Deleting %d phenotypes', len(ids))
         return container.session.execute_write(del_phenotypes, ids)
 
     @classmethod
@@ -200,7 +200,7 @@ class EmptyInterface(Interface):
         :param session: Mock session to evaluate
         :return: True if closed, otherwise False
         """
-        return ~session['open']
+        return not session['open']
 
     @contextlib.contextmanager
     def session(self, *args, **kwds):
@@ -224,7 +224,7 @@ class EmptyInterface(Interface):
         :return: List of ids from the created phenotypes
         """
         phenotypes = list(phenotypes)
-        cls.logger.debug('Adding phenotypes %s', phenotypes)
+        cls.logger.debug('Adding %d phenotypes', len(phenotypes))
         return list(p['id'] for p in phenotypes)
 
     @classmethod
@@ -235,7 +235,7 @@ class EmptyInterface(Interface):
         :return: Serialized phenotypes matching the input ids
         """
         ids = list(str(id) for id in ids)
-        cls.logger.debug('Getting phenotypes %s', ids)
+        cls.logger.debug('Getting %d phenotypes', len(ids))
         return []
 
     @classmethod
@@ -246,7 +246,7 @@ class EmptyInterface(Interface):
         :return: Deleted phenotypes matching the input ids
         """
         ids = list(str(id) for id in ids)
-        cls.logger.debug('Deleting phenotypes %s', ids)
+        cls.logger.debug('Deleting %d phenotypes', len(ids))
         return []
 
     @classmethod
@@ -262,6 +262,7 @@ class EmptyInterface(Interface):
 
 class AbstractSession(abc.ABC):
     """Abstract class for Database Interface Session Object."""
+    __slots__ = ("interface", "session")
 
     def __init__(self, session, interface):
         """Generic constructor for Database Session Container Objects.
@@ -276,7 +277,7 @@ class AbstractSession(abc.ABC):
         """Decorator to ensure the method/function is called in context."""
         @functools.wraps(meth)
         def wrapped_method(self, *args, **kwds):
-            if not self.in_session:
+            if self.interface.closed(self.session):  # Skip property dispatch
                 raise RuntimeError(f"{meth} out of {self.__class__} context")
             return meth(self, *args, **kwds)
         return wrapped_method
@@ -323,13 +324,14 @@ class AbstractSession(abc.ABC):
 
 class SessionContainer(AbstractSession):
     """Generic Database Session Container for Database Interface"""
+    __slots__ = ()
 
     @property
     def in_session(self):
         """Returns if the execution pointer is inside the instance context.
         :return: True if the call is inside instance context
         """
-        return ~self.interface.closed(self.session)
+        return not self.interface.closed(self.session)
 
     @AbstractSession.require_session
     def add_phenotypes(self, phenotypes):
@@ -402,16 +404,15 @@ def get_phenotypes(tx, ids):
     :param ids: Ids from the phenotypes to collect
     :return: Serialized phenotypes matching the input ids
     """
-    query = (
-        "MATCH (x:Phenotype) WHERE x.id IN $phenotypes_ids "
+    query = (  # UNWIND keeps input order; comprehension avoids aggregation
+        "UNWIND $phenotypes_ids AS phenotype_id "
+        "MATCH (x:Phenotype { id: phenotype_id }) "
         "OPTIONAL MATCH (x)-[:IN_EXPERIMENT]->(e:Experiment) "
-        "OPTIONAL MATCH (y)-[:HAS_CHILD]->(x) "
-        "WITH x, e, collect(y.id) as p "
-        "RETURN x{.*, .score, experiment:e.name, parents:p } "
+        "RETURN x{.*, .score, experiment:e.name, "
+        "  parents:[(y)-[:HAS_CHILD]->(x) | y.id] } "
     )
-    result = [dict(r["x"]) for r in tx.run(query, phenotypes_ids=ids)]
-    result.sort(key=lambda r: ids.index(r['id']))
-    return result
+    result = tx.run(query, phenotypes_ids=ids)
+    return result.value("x")  # Map projections are already plain dicts
 
 
 @neo4j.unit_of_work(timeout=config['timeout'])
@@ -12,15 +12,17 @@ parameters at the end of the evolution process.
 """
 
 import contextlib
+import dataclasses
 import logging
-import uuid
+import secrets
 from typing import List
 
-from pydantic import BaseModel, Extra, Field, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr
 
 import gevopy.algorithms
 import gevopy.database
 import gevopy.fitness
+import gevopy.genetics
 import gevopy.tools
 from gevopy.database import EmptyInterface
 from gevopy.fitness import FitnessModel
@@ -30,24 +32,29 @@ from gevopy.tools import crossover, mutation, selection
 # https://docs.python.org/3/howto/logging-cookbook.html
 module_logger = logging.getLogger(__name__)
 
-# Default algorithm for base experiment
-DEFAULT_ALGORITHM = gevopy.algorithms.Standard(
-    selection1=selection.Ponderated(),
-    selection2=selection.Uniform(),
-    crossover=crossover.OnePoint(),
-    mutation=mutation.SinglePoint(mutpb=0.1),
-    survival_rate=0.2,
-)
+
+def default_algorithm():
+    """Builds the algorithm used by sessions when none is provided. Built
+    on demand, so imports and sessions given an algorithm skip it.
+    :return: Standard algorithm instance
+    """
+    return gevopy.algorithms.Standard(
+        selection1=selection.Ponderated(),
+        selection2=selection.Uniform(),
+        crossover=crossover.OnePoint(),
+        mutation=mutation.SinglePoint(mutpb=0.1),
+        survival_rate=0.2,
+    )
 
 
 class Experiment(BaseModel):
     """Base class for evolution experiments.
     Provides the essential attributes to create and run an experiment.
-    :param name: Experiment name, if none, generates an uuid4 string
+    :param name: Experiment name, if none, generates a random hex string
     :param database: Database interface object, defaults to EmptyInterface
     """
     database: gevopy.database.Interface = EmptyInterface()
-    name: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str = Field(default_factory=lambda: secrets.token_hex(16))
     _logger: logging.Logger = PrivateAttr()
 
     def __init__(self, **data):
@@ -90,7 +97,8 @@ class Session(BaseModel):
     """
     experiment: Experiment
     fitness: gevopy.fitness.FitnessModel = None
-    algorithm: gevopy.algorithms.Algorithm = DEFAULT_ALGORITHM
+    algorithm: gevopy.algorithms.Algorithm = Field(
+        default_factory=default_algorithm)
     database: gevopy.database.SessionContainer
     _logger: logging.Logger = PrivateAttr()
     _population: List[GenotypeModel] = PrivateAttr(default=[])
@@ -120,21 +128,21 @@ class Session(BaseModel):
         """Saves the phenotypes to the experiment database.
         :param phenotypes: List of phenotypes to add to the experiment
         """
-        if any(not isinstance(x, GenotypeModel) for x in phenotypes):
-            raise ValueError("Phenotypes must inherit from GenotypeModel")
-        iserial_phenotypes = (p.dict(serialize=True) for p in phenotypes)
-        self.database.add_phenotypes(iserial_phenotypes)  # Iter to speed up
+        serial_phenotypes = gevopy.genetics.serialize(phenotypes)
+        self.database.add_phenotypes(serial_phenotypes)
 
     def add_phenotypes(self, phenotypes, save=True):
         """Adds phenotypes to the experiment session population.
         :param phenotypes: List of phenotypes to add to the experiment
         :param save: Flag to save new population status in database
         """
+        if any(not isinstance(x, GenotypeModel) for x in phenotypes):
+            raise ValueError("Phenotypes must inherit from GenotypeModel")
         for phenotype in phenotypes:  # Add experiment to phenotypes
             phenotype.experiment = self.experiment.name
         if save:
             self.save_phenotypes(phenotypes)
-        self._population += phenotypes
+        self._population.extend(phenotypes)
 
     def get_phenotypes(self):
         """Gets population phenotypes from the experiment session.
@@ -149,13 +157,12 @@ class Session(BaseModel):
         self._population = []
 
     def eval_phenotypes(self, fitness, save=True):
-        """Executes the fitness evaluation on the session population.
-        :param algorithm: Algorithm to run each execution generation cycle
+        """Executes the fitness evaluation on the session phenotypes without
+        score. Use `reset_score` to evaluate again all the population.
+        :param fitness: Fitness model to score the phenotypes
         :param save: Flag to save new population status in database
         """
-        if not isinstance(fitness, FitnessModel):
-            raise ValueError("Expected 'FitnessModel' type for 'fitness'")
-        fitness(self._population)
+        fitness([x for x in self._population if x.score is None])
         if save:
             self.save_phenotypes(self._population)
 
@@ -164,8 +171,6 @@ class Session(BaseModel):
         :param algorithm: Algorithm to run for producing the offspring
         :param save: Flag to save new population status in database
         """
-        if not isinstance(algorithm, gevopy.algorithms.Algorithm):
-            raise ValueError("Expected 'Algorithm' type for 'algorithm'")
         self._population = algorithm(self._population)
         if save:
             self.save_phenotypes(self._population)
@@ -179,10 +184,15 @@ class Session(BaseModel):
         if save:
             self.save_phenotypes(self._population)
 
-    def run(self, max_generation=None, max_score=None):
+    def run(
+        self, max_generation=None, max_score=None,
+        save_every=1, save_final=True,
+    ):
         """Executes the algorithm until a stop condition is met.
         :param max_generation: The maximum number of loops to run
         :param max_score: The score required to stop the evolution
+        :param save_every: Generations between database saves, 0 disables
+        :param save_final: Flag to save the last population if not saved
         :return: Generated Execution instance
         """
         if (max_generation is None) and (max_score is None):
@@ -193,20 +203,38 @@ class Session(BaseModel):
             raise ValueError('Expected positive int for max_generation')
         if max_score and not isinstance(max_score, (float, int)):
             raise TypeError('Expected int or float for max_score')
+        if not isinstance(save_every, int):
+            raise TypeError('Expected positive int for save_every')
+        if save_every < 0:
+            raise ValueError('Expected positive int for save_every')
+        if not isinstance(self.fitness, FitnessModel):  # Once per run
+            raise ValueError("Expected 'FitnessModel' type for 'fitness'")
+        if not isinstance(self.algorithm, gevopy.algorithms.Algorithm):
+            raise ValueError("Expected 'Algorithm' type for 'algorithm'")
 
+        fitness, algorithm = self.fitness, self.algorithm  # Read once
         execution = Execution(experiment=self.experiment)
         logger = execution._logger
+        log_cycles = logger.isEnabledFor(logging.INFO)  # Checked once
 
         try:
             logger.info("Start of evolutionary experiment execution")
-            self.eval_phenotypes(self.fitness, save=True)  # Evaluate 1st pop
-            execution.halloffame.update(self.get_phenotypes())
+            saved = save_every > 0  # Generation 0 is always a checkpoint
+            self.eval_phenotypes(fitness, save=saved)  # Evaluate 1st pop
+            pool = self.get_phenotypes()  # Sorted once for hall and algorithm
+            execution.update(pool)
             while not execution.completed(max_generation, max_score):
                 execution.generation += 1  # Increase generation index
-                self.generate_offspring(self.algorithm, save=False)
-                self.eval_phenotypes(self.fitness, save=True)
-                execution.halloffame.update(self.get_phenotypes())
-                logger.info("Completed cycle; %s", execution.best_score)
+                self._population = algorithm(pool)
+                saved = (save_every > 0 and
+                         execution.generation % save_every == 0)
+                self.eval_phenotypes(fitness, save=saved)
+                pool = self.get_phenotypes()
+                execution.update(pool)
+                if log_cycles:
+                    logger.info("Completed cycle; %s", execution.best_score)
+            if save_final and not saved:
+                self.save_phenotypes(self._population)
         except KeyboardInterrupt:
             logger.error("Experiment cancelled by the user 'CTRL+C'")
             return execution
@@ -218,29 +246,27 @@ class Session(BaseModel):
             return execution
 
 
-class Execution(BaseModel):
+@dataclasses.dataclass(slots=True)
+class Execution:
     """Base class for evolution algorithm execution. This class uses an
     experiment session to run evolution cycles and generations on a population
     of phenotypes. It also includes statistics about the execution process.
 
-    Note that if neither max_generation or max_score are defined, the
-    constructor raises ValueError for required valid end conditions.
+    It is a plain slots dataclass as its attributes are written on each
+    generation, where pydantic assignment handling adds unneeded overhead.
     """
-    halloffame: gevopy.tools.HallOfFame = gevopy.tools.HallOfFame(3)
+    experiment: dataclasses.InitVar[Experiment]
+    halloffame: gevopy.tools.HallOfFame = dataclasses.field(
+        default_factory=lambda: gevopy.tools.HallOfFame(3))
     generation: int = 0
-    _logger: logging.Logger = PrivateAttr()
+    _best_score: float = dataclasses.field(default=None, init=False)
+    _logger: logging.Logger = dataclasses.field(init=False, repr=False)
 
-    def __init__(self, experiment):
-        super().__init__()
+    def __post_init__(self, experiment):
         logger_data = {"exp": experiment.name, "exe": self}
         self._logger = logging.getLogger(f"{__package__}.Experiment")
         self._logger = self.Logger(self._logger, logger_data)
 
-    class Config:
-        # pylint: disable=missing-class-docstring
-        # pylint: disable=too-few-public-methods
-        extra = Extra.forbid
-
     def __repr__(self) -> str:
         return (
             "Evolutionary algorithm execution report:\n"
@@ -254,10 +280,16 @@ class Execution(BaseModel):
         """Best score reached by the evaluated phenotypes during the run.
         :return: Float (not only positive)
         """
-        try:  # If not started, halloffame is empty and raises IndexError
-            return self.halloffame[0].score
-        except IndexError:  # Empty if not started
-            return None
+        return self._best_score  # None if not started
+
+    def update(self, pool):
+        """Updates the hall of fame with a pool of evaluated phenotypes and
+        caches the best score, so it is not read from the hall each time.
+        :param pool: A pool of evaluated phenotypes
+        """
+        self.halloffame.update(pool)
+        if self.halloffame:  # Empty if the pool has no phenotypes
+            self._best_score = self.halloffame[0].score
 
     class Logger(logging.LoggerAdapter):
         # pylint: disable=missing-class-docstring
@@ -270,10 +302,9 @@ class Execution(BaseModel):
         :param max_score: The score required to stop the evolution
         :return: True if evolution conditions are met, False otherwise
         """
-        if max_generation:
-            if self.generation and max_generation <= self.generation:
-                return True
-        if max_score:
-            if self.best_score and max_score <= self.best_score:
-                return True
+        if max_generation and max_generation <= self.generation:
+            return True
+        if max_score:  # Read best score once, it goes through halloffame
+            best_score = self.best_score
+            return best_score is not None and max_score <= best_score
         return False  # If any of the defined
@@ -10,21 +10,70 @@ A rework form:
 https://github.com/DEAP/deap/blob/master/deap/base.py
 """
 
+import collections
+import hashlib
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
-
-from dask import compute, delayed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from gevopy import genetics
 
+try:  # Optional, faster hashing for the score cache keys
+    import xxhash
+except ImportError:
+    xxhash = None
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+CACHE_MAXSIZE = 1024  # Default scores kept, about 10 populations of 100
+
+
+def _digest_feature(digest, value):
+    """Updates the digest with a chromosome or nested containers of them.
+    Markers, sizes and lengths delimit the contents so different layouts
+    never collide.
+    :param digest: Hash object to update with the feature contents
+    :param value: Chromosome, list, tuple or dict of features
+    """
+    match value:
+        case genetics.Chromosome():
+            digest.update(b"c" + value.size.to_bytes(8, "little"))
+            digest.update(value.tobytes())
+        case list() | tuple():
+            marker = b"l" if isinstance(value, list) else b"t"
+            digest.update(marker + len(value).to_bytes(8, "little"))
+            for item in value:
+                _digest_feature(digest, item)
+        case dict():
+            digest.update(b"d" + len(value).to_bytes(8, "little"))
+            for key in sorted(value, key=repr):  # Insertion order ignored
+                _digest_feature(digest, key)
+                _digest_feature(digest, value[key])
+        case None:
+            digest.update(b"n")
+        case str() | int() | float():
+            text = repr(value).encode()
+            digest.update(b"p" + len(text).to_bytes(8, "little") + text)
+        case _:
+            raise TypeError(
+                f"Cannot compute a cache key from '{type(value)}' values")
+
 
 class _HasCache():
     """Extend class Fitness with cache properties."""
 
-    def __init__(self, *args, cache: bool = False, **kwargs) -> None:
+    def __init__(
+        self, *args, cache: bool = False,
+        cache_maxsize: int = CACHE_MAXSIZE, **kwargs
+    ) -> None:
         """Generic constructor for fitness objects.
         :param cache: Enables cache with True, default is False
+        :param cache_maxsize: Maximum cached scores, None for unbounded
         """
         super().__init__(*args, **kwargs)
+        self.cache_maxsize = cache_maxsize
         self.cache = cache
 
     @property
@@ -41,36 +90,155 @@ class _HasCache():
         """
         if not isinstance(value, bool):
             raise ValueError("Expected 'bool' type for cache")
-        self._cv = {} if value else None
+        self._cv = collections.OrderedDict() if value else None
+        self._hits, self._misses = 0, 0
+
+    def cache_info(self):
+        """Reports the score cache statistics, similar to functools.
+        :return: CacheInfo with hits, misses, maxsize and currsize
+        """
+        currsize = len(self._cv) if self._cv is not None else 0
+        return CacheInfo(
+            self._hits, self._misses, self.cache_maxsize, currsize)
+
+    @property
+    def cache_maxsize(self):
+        """Returns the maximum number of scores kept in the cache.
+        :return: Positive integer or None when the cache is unbounded
+        """
+        return self.__cache_maxsize
+
+    @cache_maxsize.setter
+    def cache_maxsize(self, value):
+        """Configures the maximum number of scores kept in the cache.
+        :param value: Positive integer or None for an unbounded cache
+        """
+        match value:
+            case None:
+                pass
+            case _ if not isinstance(value, int):
+                raise ValueError("Expected 'int' or None for cache_maxsize")
+            case _ if not value > 0:
+                raise ValueError("Expected cache_maxsize value higher than 0")
+        self.__cache_maxsize = value
+
+    @staticmethod
+    def cache_key(phenotype):
+        """Returns a key computed from the phenotype chromosomes contents so
+        functionally equivalent phenotypes share the cached score.
+        :param phenotype: Phenotype to generate the key from
+        :return: Bytes digest of the phenotype chromosomes
+        """
+        if xxhash is not None:
+            digest = xxhash.xxh3_128()
+        else:
+            digest = hashlib.blake2b(digest_size=16)
+        digest.update(phenotype.__class__.__qualname__.encode())
+        for name in genetics.chromosome_fields(type(phenotype)):
+            _digest_feature(digest, getattr(phenotype, name))
+        return digest.digest()
+
+    def cache_update(self, scores):
+        """Stores scores as most recently used, evicting the oldest ones
+        when the cache exceeds the configured maximum size.
+        :param scores: Dictionary of cache keys and phenotype scores
+        """
+        for key, score in scores.items():
+            self._cv[key] = score
+            self._cv.move_to_end(key)
+        if self.cache_maxsize is not None:
+            while len(self._cv) > self.cache_maxsize:
+                self._cv.popitem(last=False)
 
 
 class _HasScheduler():
-    """Extend class Fitness dask scheduler properties."""
+    """Extend class Fitness scheduler properties."""
     scheduler_options = ['synchronous', 'threads', 'processes']
 
-    def __init__(self, *args, scheduler: str = "threads", **kwargs) -> None:
+    def __init__(
+        self, *args, scheduler: str = "threads", num_workers: int = None,
+        **kwargs
+    ) -> None:
         """Generic constructor for fitness objects.
-        :param scheduler: Dask scheduler to use during fitness evaluation
+        :param scheduler: Scheduler to use during fitness evaluation
+        :param num_workers: Number of parallel workers, default None (cpus)
         """
         super().__init__(*args, **kwargs)
+        self._executor = None
+        self.num_workers = num_workers
         self.scheduler = scheduler
 
+    def __getstate__(self):
+        """Excludes the pool and cached scores when the object is sent to
+        workers or copied, the cache is kept enabled but empty."""
+        cache = collections.OrderedDict() if self._cv is not None else None
+        return {**self.__dict__, '_executor': None, '_cv': cache}
+
     @property
     def scheduler(self):
-        """Returns the configured value for dask scheduler in the object.
+        """Returns the configured value for scheduler in the object.
         :return: A string containing one of the 'scheduler_options'
         """
         return self.__scheduler
 
     @scheduler.setter
     def scheduler(self, value):
-        """Configures/edits the dask scheduler for phenotypes evaluation.
+        """Configures/edits the scheduler for phenotypes evaluation.
+        The 'processes' scheduler requires fitness and genotype classes
+        importable by the workers, i.e. not defined in `__main__`.
         :param value: A string containing one of the 'scheduler_options'
         """
         if value not in self.scheduler_options:
             raise ValueError(f"Unknown '{value}' value for scheduler")
+        self.close()  # Pool is not valid for the new scheduler
         self.__scheduler = value
 
+    @property
+    def num_workers(self):
+        """Returns the number of workers used by parallel schedulers.
+        :return: Positive integer or None to use the number of cpus
+        """
+        return self.__num_workers
+
+    @num_workers.setter
+    def num_workers(self, value):
+        """Configures the number of workers used by parallel schedulers.
+        :param value: Positive integer or None to use the number of cpus
+        """
+        match value:
+            case None:
+                pass
+            case _ if not isinstance(value, int):
+                raise ValueError("Expected 'int' or None for num_workers")
+            case _ if not value > 0:
+                raise ValueError("Expected num_workers value higher than 0")
+        self.close()  # Pool is not valid for the new number of workers
+        self.__num_workers = value
+
+    @property
+    def executor(self):
+        """Returns the pool reused between evaluations, so workers are not
+        started every call. Created on first use for the scheduler.
+        :return: Thread or process pool executor, None for 'synchronous'
+        """
+        if self._executor is not None:
+            return self._executor
+        match self.scheduler:
+            case 'threads':
+                self._executor = ThreadPoolExecutor(self.num_workers)
+            case 'processes':
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.num_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+        return self._executor
+
+    def close(self):
+        """Shuts down the pool of workers if any was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
 
 class FitnessModel(_HasCache, _HasScheduler, ABC):
     """Fitness base class to run phenotypes evaluation.
@@ -78,14 +246,27 @@ class FitnessModel(_HasCache, _HasScheduler, ABC):
     as input and returns its score value. Use cache and scheduler to control
     how the evaluation is executed:
 
-      - If phenotype score does not change between generations, you can use
-        `cache=True` to skip score computation on those phenotypes whose id
-        has been already evaluated.
+      - If phenotype score depends only on its chromosomes, you can use
+        `cache=True` to skip score computation on those phenotypes whose
+        chromosomes have been already evaluated. Use `cache_maxsize` to
+        limit the number of scores kept (least recently used are dropped,
+        default 1024, None for unbounded) and `cache_info` to check the
+        hits and misses of the cache.
+        Keys are hashed with `xxhash` if installed, otherwise `blake2b`.
 
       - If phenotypes interact between them, or have some waiting times on
         the evaluation process, you might want to set `scheduler="threads"`
-        to run multiple phenotypes in parallel. Scheduler is based on Dask,
-        see https://docs.dask.org/en/stable/scheduling.html
+        to run multiple phenotypes in parallel, or "processes" for CPU
+        bound scores. Schedulers run on `concurrent.futures` pools, use
+        `num_workers` to limit the parallel workers; the pool is kept
+        between calls until `close` is called. With "processes" the
+        fitness and genotype classes are pickled by reference, so they
+        must be defined in an importable module (not in `__main__`).
+
+      - If phenotypes can be scored together (for example with numpy
+        operations over all chromosomes), override `score_batch` to
+        evaluate the whole batch in a single call instead of one task
+        per phenotype.
 
     Additionally you can configure a setUp function which would be executed
     once, before evaluating the phenotypes.
@@ -99,12 +280,47 @@ class FitnessModel(_HasCache, _HasScheduler, ABC):
         :param phenotypes: List with phenotypes to score
         """
         self.setup(phenotypes)
-        delayeds = [delayed(self.worker)(ph) for ph in phenotypes]
-        scores = compute(*delayeds, scheduler=self.scheduler)
+        if not self.cache:
+            self.evaluate(phenotypes)
+            return
+        keys = [self.cache_key(ph) for ph in phenotypes]
+        known = {key: self._cv[key] for key in keys if key in self._cv}
+        missing = {k: p for k, p in zip(keys, phenotypes) if k not in known}
+        self.evaluate(list(missing.values()))  # Once per equivalent group
+        self._hits += len(phenotypes) - len(missing)
+        self._misses += len(missing)
+        known |= {key: phenotype.score for key, phenotype in missing.items()}
+        for key, phenotype in zip(keys, phenotypes):
+            phenotype.score = known[key]
+        self.cache_update(known)
+
+    def evaluate(self, phenotypes):
+        """Evaluates the phenotypes and assigns the resulting scores.
+        :param phenotypes: List with phenotypes to score
+        """
+        if not phenotypes:  # i.e. all cache hits, nothing to score
+            return
+        scores = self.score_batch(phenotypes)
         for phenotype, score in zip(phenotypes, scores):
             phenotype.score = score
-        if self.cache:
-            self._cv = {ph.id: ph.score for ph in phenotypes}
+
+    def score_batch(self, phenotypes):
+        """Fitness function to return the scores of a batch of phenotypes.
+        By default runs `worker` for each phenotype on the scheduler pool.
+        Override it to score the whole batch at once (i.e. vectorized).
+        :param phenotypes: List with phenotypes to score
+        :return: Sequence of float scores in the same order as phenotypes
+        """
+        if self.executor is None:  # Synchronous, no pool dispatch
+            return [self.worker(phenotype) for phenotype in phenotypes]
+        workers = self.num_workers or os.cpu_count() or 1
+        chunksize = max(1, len(phenotypes) // (4 * workers))
+        try:
+            return list(self.executor.map(
+                self.worker, phenotypes, chunksize=chunksize))
+        except BrokenProcessPool:
+            self.close()  # Start a new pool on the next call
+            raise
 
     def setup(self, phenotypes):
         """Fitness function designed to prepare the phenotypes evaluation.
@@ -113,15 +329,12 @@ class FitnessModel(_HasCache, _HasScheduler, ABC):
         pass  # pylint: disable=unnecessary-pass
 
     def worker(self, phenotype):
-        """Fitness wrap to return cached score value if configured.
+        """Fitness wrap to run the score method inside the scheduler.
         :param phenotype: Phenotype to evaluate
         :return: Phenotype score
         """
         assert isinstance(phenotype, genetics.GenotypeModel)
-        if self.cache and phenotype.id in self._cv:
-            return self._cv[phenotype.id]
-        else:
-            return self.score(phenotype)
+        return self.score(phenotype)
 
     @abstractmethod
     def score(self, phenotype):
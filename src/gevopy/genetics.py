@@ -9,6 +9,7 @@ depending on the complexity of your genetic model.
 """
 
 import copy
+import functools
 import json
 import uuid
 from datetime import datetime
@@ -17,19 +18,20 @@ from typing import List, MutableSequence
 
 import numpy as np
 from pydantic import BaseModel, Field, PositiveInt
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
 
 from gevopy import random as ea_random
 
 
-class Chromosome(np.ndarray, MutableSequence):
+class Chromosome(np.ndarray):
     """A chromosome is a long DNA molecule with part or all of the genetic
     material of an organism. In the case of Evolutionary Algorithms it
     contains the information required to evaluate a phenotype.
 
     This library bases chromosomes on numpy.ndarray to and therefore when
     creating one, the steps defined at `subclassing ndarray` must be followed.
-    Additionally it subclasses from `collections.abc.MutableSequence` to
-    provide additional and standard python methods such as `count`.
+    Additionally it is registered as `collections.abc.MutableSequence` and
+    provides standard python methods such as `count` using numpy.
 
     In order to suport serialization/deserialization the new method must
     accept only the first input parameter for the function np.array.
@@ -52,6 +54,30 @@ class Chromosome(np.ndarray, MutableSequence):
         if obj is None:
             return
 
+    def count(self, value):
+        """Returns the number of genes equal to value.
+        :param value: Gene value to count
+        :return: Integer with the number of occurrences
+        """
+        return int(np.count_nonzero(np.equal(self, value)))
+
+    def index(self, value, start=0, stop=None):
+        """Returns the first index of value, raises ValueError if missing.
+        :param value: Gene value to search
+        :param start: Index where to start the search
+        :param stop: Index where to stop the search
+        :return: Integer with the first index of value
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        found = np.flatnonzero(np.equal(self[start:stop], value))
+        if not found.size:
+            raise ValueError(f"{value} is not in chromosome")
+        return start + int(found[0])
+
+    def reverse(self):
+        """Reverses the chromosome genes in place."""
+        self[:] = self[::-1].copy()
+
     def insert(self, index, value):
         """Method insert is unsupported on chromosome types"""
         raise AttributeError(f"Unsupported operation by '{self.__class__}'")
@@ -71,6 +97,10 @@ class Chromosome(np.ndarray, MutableSequence):
         :param other: Chromosome to compare with
         :return: Boolean, True if are equal, otherwise False
         """
+        if isinstance(other, np.ndarray) and other.dtype == self.dtype:
+            if self.shape != other.shape:
+                return False
+            return self.tobytes() == other.tobytes()  # Single memcmp
         return np.array_equal(self, other)
 
     def __ne__(self, other):
@@ -78,7 +108,7 @@ class Chromosome(np.ndarray, MutableSequence):
         :param other: Chromosome to compare with
         :return: Boolean, True if are different, otherwise False
         """
-        return ~self.__eq__(other)
+        return not self.__eq__(other)  # __eq__ may return a python bool
 
     def __cross__(self, other):
         """Magic method to compare a chromosome bitwise.
@@ -103,6 +133,9 @@ class Chromosome(np.ndarray, MutableSequence):
         return cls(data=val)
 
 
+MutableSequence.register(Chromosome)  # Without ABC machinery on the MRO
+
+
 class Haploid(Chromosome):
     """The word haploid describes a condition, a cell, or an organism that
     contains half of the set of homologous chromosomes present in the somatic
@@ -127,7 +160,7 @@ class Haploid(Chromosome):
         """Computes and returns the bit-wise inversion of the chromosome.
         :return: Chromosome with inverted values
         """
-        return np.logical_not(self).view("uint8")
+        return np.bitwise_xor(self, 1)  # Single ufunc, no bool array
 
     def __mutate__(self):
         """Computes and returns the bit-wise mutation of the chromosome.
@@ -157,7 +190,7 @@ class Diploid(Chromosome):
         """Computes and returns the bit-wise inversion of the chromosome.
         :return: Chromosome with inverted values
         """
-        return np.bitwise_and(super().__invert__(), 3)
+        return np.bitwise_xor(self, 3)  # Same as ~x & 3, single ufunc
 
     def __mutate__(self):
         """Computes and returns the bit-wise mutation of the chromosome.
@@ -186,7 +219,7 @@ class Triploid(Chromosome):
         """Computes and returns the bit-wise inversion of the chromosome.
         :return: Chromosome with inverted values
         """
-        return np.bitwise_and(super().__invert__(), 7)
+        return np.bitwise_xor(self, 7)  # Same as ~x & 7, single ufunc
 
     def __mutate__(self):
         """Computes and returns the bit-wise mutation of the chromosome.
@@ -220,7 +253,9 @@ class GenotypeModel(BaseModel):
     class Config:
         # pylint: disable=missing-class-docstring
         # pylint: disable=too-few-public-methods
-        json_encoders = {Chromosome: lambda x: x.astype("uint8").tolist()}
+        json_encoders = {  # Genes are already uint8, avoid array copies
+            Chromosome: lambda x: x.astype("uint8", copy=False).tolist()
+        }
 
     def __repr__(self):
         return pformat(self.__dict__, sort_dicts=False)
@@ -239,7 +274,122 @@ class GenotypeModel(BaseModel):
         """Copies the phenotype using a different id and empty score.
         :return: Phenotype copy
         """
-        clone = copy.deepcopy(self)
-        clone.id = uuid.uuid4()  # Generate new id
-        clone.score = None  # Reset the clone score
+        data = {}  # Copy only what is mutable, skip the deepcopy walk
+        for name, value in self.__dict__.items():
+            match value:
+                case Chromosome():
+                    data[name] = value.copy()
+                case uuid.UUID() | datetime() | str() | int() | float() | None:
+                    data[name] = value
+                case _:
+                    data[name] = copy.deepcopy(value)
+        data['id'] = uuid.uuid4()  # Generate new id
+        data['score'] = None  # Reset the clone score
+        clone = self.construct(set(self.__fields_set__), **data)
+        for name in self.__private_attributes__:
+            value = copy.deepcopy(getattr(self, name, None))
+            object.__setattr__(clone, name, value)
         return clone
+
+
+def serialize(phenotypes):
+    """Serializes a list of phenotypes, same as `dict(serialize=True)` on
+    each phenotype. Uses the genotype class specialized serializer when
+    possible, otherwise a single json round trip for all phenotypes.
+    :param phenotypes: List of phenotypes to serialize
+    :return: List of serialized dictionaries in the same order
+    """
+    phenotypes = list(phenotypes)
+    serializers = {cls: serializer(cls) for cls in map(type, phenotypes)}
+    if all(serializers.values()):  # All classes have fast serializer
+        return [serializers[type(p)](p) for p in phenotypes]
+    encoders = {p.__json_encoder__ for p in phenotypes}
+    if len(encoders) != 1:  # Mixed or no phenotype classes, use each one
+        return [p.dict(serialize=True) for p in phenotypes]
+    data = [p.dict() for p in phenotypes]
+    return json.loads(json.dumps(data, default=encoders.pop()))
+
+
+def stack(phenotypes, name="chromosome"):
+    """Stacks a chromosome attribute of the phenotypes into a 2-D array,
+    one row per phenotype, so it can be scored with numpy operations.
+    :param phenotypes: List of phenotypes with same chromosome length
+    :param name: Name of the chromosome attribute to stack
+    :return: Numpy uint8 array with shape (phenotypes, chromosome size)
+    """
+    if not phenotypes:  # Size unknown, so an empty (0, 0) array
+        return np.empty((0, 0), dtype="uint8")
+    chromosomes = [getattr(p, name) for p in phenotypes]
+    return np.stack(chromosomes).view(np.ndarray)
+
+
+@functools.lru_cache(maxsize=None)
+def chromosome_fields(cls):
+    """Returns once per genotype class the names of the fields declared
+    as chromosomes, either directly or inside (nested) lists.
+    :param cls: GenotypeModel subclass to inspect
+    :return: Tuple with the chromosome field names
+    """
+    fields = cls.__fields__.items()
+    return tuple(name for name, field in fields if _has_chromosomes(field))
+
+
+@functools.lru_cache(maxsize=None)
+def serializer(cls):
+    """Builds once per genotype class a function that serializes phenotypes
+    reading their fields directly, skipping the pydantic json walk.
+    :param cls: GenotypeModel subclass to build the serializer for
+    :return: Function phenotype -> dict, None if a field is not supported
+    """
+    if cls.__config__.json_encoders != GenotypeModel.__config__.json_encoders:
+        return None  # Custom json encoders, use pydantic
+    encoders = {name: _field_encoder(f) for name, f in cls.__fields__.items()}
+    if not all(encoders.values()):
+        return None  # Unsupported field types, use pydantic
+
+    def serialize_phenotype(phenotype):
+        values = phenotype.__dict__
+        return {key: encode(values[key]) for key, encode in encoders.items()}
+
+    return serialize_phenotype
+
+
+def _field_encoder(field):
+    """Returns a json compatible encoder for the model field values.
+    :param field: Pydantic model field
+    :return: Function value -> encoded value, None if not supported
+    """
+    match field.type_:
+        case type() as type_ if issubclass(type_, Chromosome):
+            encode = np.ndarray.tolist
+        case type() as type_ if issubclass(type_, uuid.UUID):
+            encode = str
+        case type() as type_ if issubclass(type_, datetime):
+            encode = datetime.isoformat
+        case type() as type_ if issubclass(type_, (str, int, float)):
+            encode = _encode_primitive
+        case _:
+            return None
+    if field.shape == SHAPE_SINGLETON:
+        return lambda x: None if x is None else encode(x)
+    if field.shape == SHAPE_LIST:
+        return lambda x: None if x is None else [encode(v) for v in x]
+    return None  # Other shapes (i.e. dict), use pydantic
+
+
+def _has_chromosomes(field):
+    """Returns True if the field declares chromosomes, either directly or
+    inside lists. Nested lists keep the inner list type in `type_`, so the
+    field sub fields are walked until a chromosome type is found.
+    :param field: Pydantic model field
+    :return: Boolean indicating if the field holds chromosomes
+    """
+    match field.type_:
+        case type() as type_ if issubclass(type_, Chromosome):
+            return True
+    return any(_has_chromosomes(f) for f in field.sub_fields or [])
+
+
+def _encode_primitive(value):
+    """Returns the python value of numpy scalars, i.e. numpy scores."""
+    return value.item() if isinstance(value, np.generic) else value
@@ -6,26 +6,36 @@ import numpy as np
 
 from gevopy import genetics
 
+# Single generator reused by every call, faster than legacy np.random
+generator = np.random.default_rng()
+
+
+def seed(value=None):
+    """Seeds the generator used for random chromosomes and operators.
+    :param value: Integer seed, None to use fresh entropy from the OS
+    """
+    generator.bit_generator.state = np.random.PCG64(value).state
+
 
 def haploid(size):
     """Returns a random standard Haploid chromosome.
     :param size: Integer with chromosome size
     """
-    data = np.random.randint(2 ** 1, size=size, dtype="uint8")
-    return genetics.Haploid(data)
+    data = generator.integers(2 ** 1, size=size, dtype="uint8")
+    return data.view(genetics.Haploid)  # Already uint8, no copy
 
 
 def diploid(size):
     """Returns a random standard Diploid chromosome.
     :param size: Integer with chromosome size
     """
-    data = np.random.randint(2 ** 2, size=size, dtype="uint8")
-    return genetics.Diploid(data)
+    data = generator.integers(2 ** 2, size=size, dtype="uint8")
+    return data.view(genetics.Diploid)  # Already uint8, no copy
 
 
 def triploid(size):
     """Returns a random standard Triploid chromosome.
     :param size: Integer with chromosome size
     """
-    data = np.random.randint(2 ** 3, size=size, dtype="uint8")
-    return genetics.Triploid(data)
+    data = generator.integers(2 ** 3, size=size, dtype="uint8")
+    return data.view(genetics.Triploid)  # Already uint8, no copy
@@ -15,6 +15,7 @@ from abc import ABC, abstractmethod
 import numpy as np
 
 from gevopy import genetics, utils
+from gevopy import random as ea_random
 
 methods = {"OnePoint", "TwoPoint", "MultiPoint", "Uniform"}
 __all__ = methods.union({"Crossover"})
@@ -51,20 +52,26 @@ class Crossover(ABC):
             child.parents = parents_id
 
         if phenotype_1 != phenotype_2:  # Cross only if different parents
-            self.cross_features(*[x.__dict__.values() for x in children])
+            names = genetics.chromosome_fields(type(phenotype_1))
+            features = [[getattr(x, n, None) for n in names] for x in children]
+            self.cross_features(*features)
         return children
 
     def cross_features(self, features_1, features_2):
-        """Recursively crosses phenotype features. For example a list of
-        diploids in the case of Eucaryote genotype.
+        """Crosses phenotype features, walking nested lists with a worklist
+        instead of recursion. For example a list of diploids in the case of
+        Eucaryote genotype.
         :param features_1: Phenotype 1 list of feature values
         :param features_2: Phenotype 2 list of feature values
         """
-        for values in zip(features_1, features_2):
-            if all(isinstance(v, genetics.Chromosome) for v in values):
-                self.cross_chromosomes(values[0], values[1])
-            elif all(isinstance(v, list) for v in values):
-                self.cross_features(values[0], values[1])
+        pending = [(features_1, features_2)]
+        while pending:
+            for value_1, value_2 in zip(*pending.pop()):
+                if isinstance(value_1, genetics.Chromosome):
+                    if isinstance(value_2, genetics.Chromosome):
+                        self.cross_chromosomes(value_1, value_2)
+                elif isinstance(value_1, list) and isinstance(value_2, list):
+                    pending.append((value_1, value_2))
 
     @abstractmethod
     def cross_chromosomes(self, chromosome_1, chromosome_2):
@@ -104,6 +111,8 @@ class Uniform(Crossover):
                 self.index_probability = indpb
             case _:
                 raise ValueError("Type for 'indpb' must be 'float'")
+        self._buffer = np.empty(0, dtype=np.float32)  # Reused random draws
+        self._mask = np.empty(0, dtype=bool)  # Reused comparison output
 
     def cross_chromosomes(self, chromosome_1, chromosome_2):
         """Executes the crossover between chromosomes. The two chromosomes
@@ -111,9 +120,16 @@ class Uniform(Crossover):
         :param chromosome_1: First chromosome participating in the crossover
         :param chromosome_2: Second chromosome participating in the crossover
         """
-        mask = np.random.random(len(chromosome_1)) <= self.index_probability
+        size = len(chromosome_1)
+        if self._buffer.size < size:  # Grows to the largest size
+            self._buffer = np.empty(size, dtype=np.float32)
+            self._mask = np.empty(size, dtype=bool)
+        draws, mask = self._buffer[:size], self._mask[:size]
+        ea_random.generator.random(dtype=np.float32, out=draws)
+        np.less(draws, self.index_probability, out=mask)  # Draws in [0, 1)
+        index = np.flatnonzero(mask)  # Scan once
         ch1, ch2 = chromosome_1, chromosome_2  # Code len reduction
-        ch1[mask], ch2[mask] = ch2[mask], ch1[mask]
+        ch1[index], ch2[index] = ch2[index], ch1[index]
 
 
 class MultiPoint(Crossover):
@@ -141,7 +157,8 @@ class MultiPoint(Crossover):
         :param chromosome_2: Second chromosome participating in the crossover
         """
         lengths = len(chromosome_1), len(chromosome_2)
-        points = np.random.randint(min(*lengths), size=self.number_points)
+        points = ea_random.generator.integers(
+            min(*lengths), size=self.number_points)
         points.sort()
         utils.cross_chromosomes(chromosome_1, chromosome_2, points)
 
@@ -156,6 +173,18 @@ class OnePoint(MultiPoint):
         """Constructor for one point crossover."""
         super().__init__(n=1)
 
+    def cross_chromosomes(self, chromosome_1, chromosome_2):
+        """Executes the crossover between chromosomes. The two chromosomes
+        are modified in place and both keep their original length.
+        :param chromosome_1: First chromosome participating in the crossover
+        :param chromosome_2: Second chromosome participating in the crossover
+        """
+        lengths = len(chromosome_1), len(chromosome_2)
+        start = ea_random.generator.integers(min(*lengths))  # No sort
+        ch1, ch2 = chromosome_1, chromosome_2  # Code len reduction
+        segment = ch1[start:].copy()
+        ch1[start:], ch2[start:] = ch2[start:], segment
+
 
 class TwoPoint(MultiPoint):
     """Executes a two point crossover on the input phenotypes chromosomes.
@@ -166,3 +195,16 @@ class TwoPoint(MultiPoint):
     def __init__(self):
         """Constructor for two point crossover."""
         super().__init__(n=2)
+
+    def cross_chromosomes(self, chromosome_1, chromosome_2):
+        """Executes the crossover between chromosomes. The two chromosomes
+        are modified in place and both keep their original length.
+        :param chromosome_1: First chromosome participating in the crossover
+        :param chromosome_2: Second chromosome participating in the crossover
+        """
+        lengths = len(chromosome_1), len(chromosome_2)
+        points = ea_random.generator.integers(min(*lengths), size=2)
+        start, stop = sorted(points.tolist())  # Python ints, no array sort
+        ch1, ch2 = chromosome_1, chromosome_2  # Code len reduction
+        segment = ch1[start:stop].copy()
+        ch1[start:stop], ch2[start:stop] = ch2[start:stop], segment
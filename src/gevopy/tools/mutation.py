@@ -9,11 +9,11 @@ https://github.com/DEAP/deap/blob/master/deap/tools/mutation.py
 # pylint: disable=too-few-public-methods
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
 
 import numpy as np
 
 from gevopy import genetics
+from gevopy import random as ea_random
 
 methods = {"SinglePoint"}
 __all__ = methods.union({"Mutation"})
@@ -39,8 +39,8 @@ class Mutation(ABC):
     """
 
     def __call__(self, phenotype):
-        """Executes the mutation on a phenotype. If the phenotype was never
-        evaluated, then clone is an exact copy maintaining id and parents.
+        """Executes the mutation on a copy of the phenotype. The copy keeps
+        the id and parents, but its score is always cleared.
         :param phenotype: The phenotype to mutate
         :return: Mutated phenotype
         """
@@ -48,20 +48,25 @@ class Mutation(ABC):
             case _ if not isinstance(phenotype, genetics.GenotypeModel):
                 raise ValueError("Expected 'GenotypeModel' for 'phenotype'")
 
-        phenotype_copy = deepcopy(phenotype)
-        self.mutate_features(phenotype_copy.__dict__.values())
+        phenotype_copy = phenotype.clone()  # Clears score, needs evaluation
+        phenotype_copy.id = phenotype.id  # Mutation keeps the phenotype id
+        names = genetics.chromosome_fields(type(phenotype))
+        self.mutate_features([getattr(phenotype_copy, n) for n in names])
         return phenotype_copy
 
     def mutate_features(self, features):
-        """Recursively mutates phenotype features. For example a list of
-        diploids in the case of Eucaryote genotype.
+        """Mutates phenotype features, walking nested lists with a worklist
+        instead of recursion. For example a list of diploids in the case of
+        Eucaryote genotype.
         :param features: Phenotype list of feature values
         """
-        for value in features:
-            if isinstance(value, genetics.Chromosome):
-                self.mutate_chromosome(chromosome=value)
-            elif isinstance(value, list):
-                self.mutate_features(features=value)
+        pending = [features]
+        while pending:
+            for value in pending.pop():
+                if isinstance(value, genetics.Chromosome):
+                    self.mutate_chromosome(chromosome=value)
+                elif isinstance(value, list):
+                    pending.append(value)
 
     @abstractmethod
     def mutate_chromosome(self, chromosome):
@@ -101,10 +106,19 @@ class SinglePoint(Mutation):
         :param mutpb: Probability of each slot mutation, defaults to 0.05
         """
         self.mutation_probability = mutpb
+        self._buffer = np.empty(0, dtype=np.float32)  # Reused random draws
+        self._mask = np.empty(0, dtype=bool)  # Reused comparison output
 
     def mutate_chromosome(self, chromosome):
         """Executes the mutation. The chromosome chain is modified in place.
         :param chromosome: Chromosome to be mutated
         """
-        mask = np.random.random(chromosome.size) <= self.mutation_probability
-        chromosome[mask] = chromosome[mask].__mutate__()
+        size = chromosome.size
+        if self._buffer.size < size:  # Grows to the largest size
+            self._buffer = np.empty(size, dtype=np.float32)
+            self._mask = np.empty(size, dtype=bool)
+        draws, mask = self._buffer[:size], self._mask[:size]
+        ea_random.generator.random(dtype=np.float32, out=draws)
+        np.less(draws, self.mutation_probability, out=mask)  # Draws in [0, 1)
+        index = np.flatnonzero(mask)  # Scan once
+        chromosome[index] = chromosome[index].__mutate__()
@@ -11,14 +11,14 @@ https://github.com/DEAP/deap/blob/master/deap/tools/selection.py
 
 import builtins
 import inspect
-import itertools
 import math
-import random
 import types
 from abc import ABC, abstractmethod
 
 import numpy as np
 
+from gevopy import random as ea_random
+
 from . import Pool
 
 methods = {"Ponderated", "Uniform", "Best", "Worst", "Tournaments"}
@@ -73,16 +73,16 @@ class Ponderated(Selection):
             case _ if not n >= 0:
                 raise ValueError("Value for 'n' cannot be lower than 0")
 
-        sum_scores = sum(pool.scores())
-        try:  # Divide R[0,1] segment with normalised phenotypes weigths
-            n_scores = [score / sum_scores for score in pool.scores()]
-            n_prb = list(itertools.accumulate(n_scores))
-        except ZeroDivisionError:
+        weights = np.cumsum(pool.scores(), dtype="float64")  # Read once
+        if not weights.size or weights[-1] == 0:  # Nothing to ponderate
             return Uniform.__call__(self, pool, n)
 
-        def choose(p):  # next avoids generating the whole list
-            return next(x for x, r in zip(pool, n_prb) if r > p)
-        return [choose(p) for p in np.random.rand(n)]
+        # Divide R[0,sum] segment with the phenotypes weights, binary search
+        points = ea_random.generator.random(n) * weights[-1]
+        indexes = weights.searchsorted(points, side="right")
+        np.minimum(indexes, weights.size - 1, out=indexes)  # Float rounding
+        phenotypes = list(pool)  # Faster indexing than the sorted list
+        return [phenotypes[i] for i in indexes.tolist()]
 
 
 class Uniform(Selection):
@@ -104,7 +104,9 @@ class Uniform(Selection):
             case _ if not n >= 0:
                 raise ValueError("Value for 'n' cannot be lower than 0")
 
-        return [random.choice(pool) for _ in range(n)]
+        indexes = ea_random.generator.integers(len(pool), size=n)
+        phenotypes = list(pool)  # Faster indexing than the sorted list
+        return [phenotypes[i] for i in indexes.tolist()]
 
 
 class Best(Selection):
@@ -126,7 +128,7 @@ class Best(Selection):
             case _ if not n >= 0:
                 raise ValueError("Value for 'n' cannot be lower than 0")
 
-        return [pool[0] for _ in range(n)]
+        return pool[:1] * n  # Empty if the pool is empty
 
 
 class Worst(Selection):
@@ -148,7 +150,7 @@ class Worst(Selection):
             case _ if not n >= 0:
                 raise ValueError("Value for 'n' cannot be lower than 0")
 
-        return [pool[-1] for _ in range(n)]
+        return pool[-1:] * n  # Empty if the pool is empty
 
 
 class Tournaments(Selection):
@@ -190,5 +192,8 @@ class Tournaments(Selection):
                 raise ValueError("Value for 'n' cannot be lower than 0")
 
         tournsize = self.tournsize(n)
-        aspirants = [Uniform.__call__(self, pool, tournsize) for _ in range(n)]
-        return [max(x, key=lambda x: x.score) for x in aspirants]
+        size = n, tournsize  # One row of aspirant indexes per tournament
+        aspirants = ea_random.generator.integers(len(pool), size=size)
+        winners = aspirants.min(axis=1, initial=len(pool))  # Pool is sorted
+        phenotypes = list(pool)  # Faster indexing than the sorted list
+        return [phenotypes[i] for i in winners.tolist()]
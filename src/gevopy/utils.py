@@ -1,7 +1,5 @@
 """Module with utilities for the evolution modules"""
 
-import numpy as np
-
 
 def cross_chromosomes(chromosome_1, chromosome_2, points):
     """Crosses chromosome arrays on the specified points.
@@ -10,6 +8,7 @@ def cross_chromosomes(chromosome_1, chromosome_2, points):
     :param points: List of points to cross
     """
     ch1, ch2 = chromosome_1, chromosome_2  # Short code
-    ax1, ax2 = np.split(ch1, points), np.split(ch2, points)
-    ax1[1::2], ax2[1::2] = ax2[1::2], ax1[1::2]
-    ch1[:], ch2[:] = np.concatenate(ax1), np.concatenate(ax2)
+    bounds = [*points, None]  # Odd segments are swapped in place
+    for start, stop in zip(bounds[0::2], bounds[1::2]):
+        segment = ch1[start:stop].copy()
+        ch1[start:stop], ch2[start:stop] = ch2[start:stop], segment
@@ -17,20 +17,22 @@ NEO4J_DRIVER = dict(
 )
 
 
-@fixture(scope="session", params=[NEO4J_DRIVER])
-def driver_kwds(request):
+@fixture(scope="session")
+def driver_kwds():
     """Fixture to generate a neo4j database driver"""
     # pylint: disable=not-context-manager
-    with GraphDatabase.driver(**request.param) as driver:
+    with GraphDatabase.driver(**NEO4J_DRIVER) as driver:
         driver.verify_connectivity()
-    return request.param
+    return NEO4J_DRIVER
 
 
 @fixture(scope="session", params=["Neo4jInterface", "EmptyInterface"])
-def db_interface(request, driver_kwds):
-    """Fixture to return the experiment interface for the database"""
+def db_interface(request):
+    """Fixture to return the experiment interface for the database,
+    only Neo4jInterface requires a running neo4j database"""
     match request.param:
         case "Neo4jInterface":
+            driver_kwds = request.getfixturevalue("driver_kwds")
             interface = Neo4jInterface(**driver_kwds)
         case _:
             interface = EmptyInterface()
@@ -44,7 +46,7 @@ def genotype(request):
     return examples.genotypes.__dict__[request.param]
 
 
-@fixture(scope="session", params=["Random"])
+@fixture(scope="session", params=["Random", "RandomBatch", "MostOnesBatch"])
 def fitness(request):
     """Fixture to return fitness class from example"""
     return examples.evaluation.__dict__[request.param]
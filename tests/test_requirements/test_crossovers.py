@@ -2,10 +2,12 @@
 # pylint: disable=redefined-outer-name
 
 from inspect import ismethod, signature
+from unittest import mock
 
 from pytest import fixture, mark
 
-from gevopy import genetics
+import examples.genotypes
+from gevopy import genetics, random
 from gevopy.tools import crossover
 
 
@@ -13,12 +15,14 @@ from gevopy.tools import crossover
 @fixture(scope="class")
 def children(crossover, parents):
     """Fixture to return crossovered phenotypes from base"""
+    random.seed(5)  # Reproducible cut points, which might coincide
     return crossover(parents[0], parents[1])
 
 
 @fixture(scope="class")
 def parents(genotype):
     """Fixture to generate a base phenotypes to cross"""
+    random.seed(0)  # Reproducible genes, which might match
     return genotype(), genotype()
 
 
@@ -124,8 +128,40 @@ class TestUniform(AttrRequirements, ExecutionRequirements):
         assert parents[0].chromosome == children[0].chromosome
         assert parents[1].chromosome == children[1].chromosome
 
+    @mark.parametrize("crossover", [0.0], indirect=True)
+    def test_indpb_000_zero_draws(self, crossover, parents):
+        """Tests that no crossover happens even when all draws are 0.0"""
+        def zeros(*_args, out, **_kwds):
+            out.fill(0.0)
+        with mock.patch.object(random, "generator") as generator:
+            generator.random.side_effect = zeros
+            children = crossover(parents[0], parents[1])
+        assert parents[0].chromosome == children[0].chromosome
+        assert parents[1].chromosome == children[1].chromosome
+
     @mark.parametrize("crossover", [1.0], indirect=True)
     def test_indpb_100(self, parents, children):
         """Tests that crossover does modity chromosome"""
         assert parents[0].chromosome != children[0].chromosome
         assert parents[1].chromosome != children[1].chromosome
+
+
+class TestNestedUniform(AttrRequirements, ExecutionRequirements):
+    """Parametrization for 'Uniform' crossover on nested chromosomes"""
+
+    @fixture(scope="class")
+    def genotype(self):
+        """Parametrization to define a genotype with nested chromosomes"""
+        return examples.genotypes.Eucaryote
+
+    @fixture(scope="class")
+    def crossover(self):
+        """Parametrization to define the crossover method to use"""
+        return crossover.Uniform(indpb=1.0)
+
+    def test_chromosomes(self, parents, children):
+        """Tests that crossover swaps all nested chromosomes genes"""
+        pairs = [(parents[1], children[0]), (parents[0], children[1])]
+        for parent, child in pairs:
+            for set_p, set_c in zip(parent.chromosomes, child.chromosomes):
+                assert all(x == y for x, y in zip(set_p, set_c))
@@ -2,9 +2,51 @@
 # pylint: disable=redefined-outer-name
 # pylint: disable=unused-argument
 
+import copy
+import os
+import pickle
+from concurrent.futures.process import BrokenProcessPool
 from inspect import ismethod, signature
+from typing import Dict, Tuple
+from unittest import mock
 
-from pytest import fixture, mark
+from pydantic import Field
+from pytest import fixture, mark, raises
+
+import examples.genotypes
+from gevopy import random
+from gevopy.fitness import CACHE_MAXSIZE, FitnessModel
+from gevopy.genetics import GenotypeModel, Haploid
+
+
+# Module genotypes and fitness --------------------------------------
+class Couple(GenotypeModel):
+    """Genotype with a tuple of chromosomes"""
+    chromosomes: Tuple[Haploid, Haploid] = Field(
+        default_factory=lambda: (random.haploid(12), random.haploid(12)))
+
+
+class Named(GenotypeModel):
+    """Genotype with a dictionary of chromosomes"""
+    chromosomes: Dict[str, Haploid] = Field(
+        default_factory=lambda: {x: random.haploid(12) for x in "xy"})
+
+
+class SumGenes(FitnessModel):
+    """Fitness model which sums the genes of all chromosomes"""
+
+    def score(self, phenotype):
+        values = phenotype.chromosomes
+        if isinstance(values, dict):
+            values = list(values.values())
+        return float(sum(chromosome.sum() for chromosome in values))
+
+
+class Crash(FitnessModel):
+    """Fitness model which kills the worker process"""
+
+    def score(self, phenotype):
+        os._exit(1)  # pylint: disable=protected-access
 
 
 # Module fixtures ---------------------------------------------------
@@ -58,8 +100,12 @@ class ExecutionRequirements:
     @mark.parametrize("use_cache", [False], indirect=True)
     def test_no_cache(self, evaluator, population, scores):
         """Test when cache=False phenotypes are reevaluated"""
-        evaluator(population)  # Run fitness a second round
-        assert scores != [ph.score for ph in population]
+        model = type(evaluator)
+        with mock.patch.object(
+            model, "score_batch", autospec=True, side_effect=model.score_batch,
+        ) as score_batch:
+            evaluator(population)  # Run fitness a second round
+        score_batch.assert_called_once_with(evaluator, population)
 
     @mark.parametrize("use_cache", [True], indirect=True)
     def test_run_cache(self, evaluator, population, scores):
@@ -67,11 +113,107 @@ class ExecutionRequirements:
         evaluator(population)  # Run fitness a second round
         assert scores == [ph.score for ph in population]
 
+    @mark.parametrize("use_cache", [True], indirect=True)
+    def test_cache_equivalent(self, evaluator, population, scores):
+        """Test when cache=True equivalent phenotypes are not reevaluated"""
+        clones = [ph.clone() for ph in population]
+        evaluator(clones)  # Clones have new ids but same chromosomes
+        assert scores == [ph.score for ph in clones]
+
+    @mark.parametrize("use_cache", [True], indirect=True)
+    def test_cache_info(self, evaluator, population, scores):
+        """Test when cache=True hits and misses are counted"""
+        misses = evaluator.cache_info().misses
+        evaluator(population)  # Run fitness a second round
+        assert evaluator.cache_info().misses == misses
+        assert evaluator.cache_info().hits >= len(population)
+
+    def test_no_phenotypes(self, evaluator):
+        """Test evaluation of an empty list of phenotypes is skipped"""
+        evaluator([])
+
     def test_setup_executed(self, evaluator):
         """Test set up function is executed before evaluation"""
         assert hasattr(evaluator, "executed")
 
 
+class ConfigRequirements:
+    """Tests group for Fitness cache and scheduler configuration"""
+
+    def test_cache_key_nested(self, evaluator):
+        """Test chromosomes inside nested lists are part of the cache key"""
+        phenotype = examples.genotypes.Eucaryote()
+        clone = phenotype.clone()
+        assert evaluator.cache_key(phenotype) == evaluator.cache_key(clone)
+        clone.chromosomes[1][0] = ~clone.chromosomes[1][0]
+        assert evaluator.cache_key(phenotype) != evaluator.cache_key(clone)
+
+    @mark.parametrize("container", [Couple, Named])
+    def test_cache_key_containers(self, container):
+        """Test tuple and dict chromosomes are part of the cache key"""
+        phenotype_1 = container()
+        phenotype_2 = phenotype_1.clone()
+        match phenotype_2.chromosomes:
+            case tuple() as chromosomes:
+                phenotype_2.chromosomes = tuple(x ^ 1 for x in chromosomes)
+            case dict() as chromosomes:
+                chromosomes["y"] = chromosomes["y"] ^ 1
+        evaluator = SumGenes(cache=True, scheduler='synchronous')
+        key_1, key_2 = map(evaluator.cache_key, [phenotype_1, phenotype_2])
+        assert key_1 != key_2
+        evaluator([phenotype_1, phenotype_2])
+        clones = [phenotype_1.clone(), phenotype_2.clone()]
+        evaluator(clones)  # Both are cache hits
+        assert evaluator.cache_info().hits == 2
+        for phenotype in [phenotype_1, phenotype_2, *clones]:
+            assert phenotype.score == evaluator.score(phenotype)
+
+    def test_cache_maxsize(self, fitness, population):
+        """Test least recently used scores are dropped past cache_maxsize"""
+        evaluator = fitness(cache=True, cache_maxsize=2)
+        unique = {evaluator.cache_key(ph): ph for ph in population}
+        ph_1, ph_2, ph_3 = [ph.clone() for ph in list(unique.values())[:3]]
+        evaluator([ph_1, ph_2])
+        evaluator([ph_1])  # Hit, ph_2 is now the least recently used
+        evaluator([ph_3])  # Cache exceeds cache_maxsize, drops ph_2
+        assert evaluator.cache_info() == (1, 3, 2, 2)
+        evaluator([ph_1])  # Hit, ph_1 is kept in the cache
+        evaluator([ph_2])  # Miss, ph_2 is evaluated again
+        assert evaluator.cache_info() == (2, 4, 2, 2)
+
+    def test_cache_maxsize_default(self, fitness):
+        """Test cache is bounded by default and unbounded on request"""
+        assert fitness(cache=True).cache_maxsize == CACHE_MAXSIZE
+        assert fitness(cache=True, cache_maxsize=None).cache_maxsize is None
+
+    @mark.parametrize("cache_maxsize", [0, -1, 1.5, "2"])
+    def test_cache_maxsize_invalid(self, fitness, cache_maxsize):
+        """Test cache_maxsize accepts only positive integers or None"""
+        with raises(ValueError):
+            fitness(cache=True, cache_maxsize=cache_maxsize)
+
+    def test_worker_state(self, evaluator):
+        """Test pool and cached scores are not sent to workers"""
+        state = evaluator.__getstate__()
+        assert state['_executor'] is None and not state['_cv']
+
+    @mark.parametrize("use_cache", [False, True])
+    def test_copy_keeps_cache(self, fitness, population, use_cache):
+        """Test copies keep the cache configuration without the scores"""
+        evaluator = fitness(cache=use_cache, scheduler='synchronous')
+        evaluator([ph.clone() for ph in population])
+        for copied in [copy.deepcopy(evaluator),
+                       pickle.loads(pickle.dumps(evaluator))]:
+            assert copied.cache is use_cache
+            assert copied.cache_info().currsize == 0
+
+    @mark.parametrize("num_workers", [0, -1, 1.5, "2"])
+    def test_num_workers_invalid(self, fitness, num_workers):
+        """Test num_workers accepts only positive integers or None"""
+        with raises(ValueError):
+            fitness(num_workers=num_workers)
+
+
 # Parametrization ---------------------------------------------------
 class TestFitness(AttrRequirements, ExecutionRequirements):
     """Parametrization for testing using TimeFitness"""
@@ -80,3 +222,30 @@ class TestFitness(AttrRequirements, ExecutionRequirements):
     def evaluator(self, fitness, use_cache, scheduler):
         """Parametrization to define the fitness method to use"""
         return fitness(cache=use_cache, scheduler=scheduler)
+
+
+class TestBrokenPool:
+    """Tests for the recovery of a broken 'processes' scheduler"""
+
+    @fixture(scope="class")
+    def use_fitness(self):
+        """Parametrization to skip the module population evaluation"""
+
+    def test_broken_pool(self):
+        """Test a broken process pool is dropped to start a new one"""
+        evaluator = Crash(scheduler='processes', num_workers=1)
+        with raises(BrokenProcessPool):
+            evaluator([examples.genotypes.Bacteria()])
+        assert evaluator._executor is None  # pylint: disable=protected-access
+        with raises(BrokenProcessPool):  # New pool, same crash
+            evaluator([examples.genotypes.Bacteria()])
+        evaluator.close()
+
+
+class TestConfig(ConfigRequirements):
+    """Parametrization for testing the fitness configuration"""
+
+    @fixture(scope="class")
+    def evaluator(self, fitness):
+        """Parametrization to define the fitness method to use"""
+        return fitness(cache=True, scheduler='synchronous')
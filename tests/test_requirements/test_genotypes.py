@@ -76,9 +76,57 @@ class CloneRequirements:
         """Test clone 'generation' is equal to phenotype"""
         assert clone.generation == phenotype.generation
 
+    def test_clone_fields_set(self, phenotype, clone):
+        """Test clone 'fields set' is a copy, not shared with phenotype"""
+        assert clone.__fields_set__ == phenotype.__fields_set__
+        assert clone.__fields_set__ is not phenotype.__fields_set__
+
+
+class SerializeRequirements:
+    """Tests group for phenotype serialization"""
+
+    def test_serialize_batch(self, phenotype, clone):
+        """Test batch serialization matches each phenotype serialization"""
+        phenotypes = [phenotype, clone]
+        expected = [ph.dict(serialize=True) for ph in phenotypes]
+        assert genetics.serialize(phenotypes) == expected
+
+    def test_fast_serializer(self, phenotype):
+        """Test genotype fields are supported by the class serializer"""
+        serializer = genetics.serializer(type(phenotype))
+        assert serializer is not None
+        assert serializer(phenotype) == phenotype.dict(serialize=True)
+
+
+class FieldsRequirements:
+    """Tests group for genotype chromosome fields"""
+
+    def test_chromosome_fields(self, phenotype):
+        """Test chromosome fields are the chromosome values of phenotype"""
+        fields = genetics.chromosome_fields(type(phenotype))
+        assert "chromosome" in fields
+        assert all(
+            isinstance(getattr(phenotype, name), (genetics.Chromosome, list))
+            for name in fields
+        )
+
+
+class StackRequirements:
+    """Tests group for phenotype chromosomes stacking"""
+
+    def test_stack_rows(self, phenotype, clone):
+        """Test stacked array has one chromosome row per phenotype"""
+        stacked = genetics.stack([phenotype, clone], "chromosome")
+        assert stacked.shape == (2, len(phenotype.chromosome))
+        assert stacked[0].tolist() == phenotype.chromosome.tolist()
+        assert stacked[1].tolist() == clone.chromosome.tolist()
+
 
 # Parametrization ---------------------------------------------------
-class TestGenotype(AttrRequirements, CloneRequirements):
+class TestGenotype(
+    AttrRequirements, CloneRequirements,
+    SerializeRequirements, FieldsRequirements, StackRequirements,
+):
     """Parametrization for testing Genotypes"""
 
     @fixture(scope="class")
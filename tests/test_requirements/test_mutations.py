@@ -2,10 +2,12 @@
 # pylint: disable=redefined-outer-name
 
 from inspect import ismethod, signature
+from unittest import mock
 
 from pytest import fixture, mark
 
-from gevopy import genetics
+import examples.genotypes
+from gevopy import genetics, random
 from gevopy.tools import mutation
 
 
@@ -68,7 +70,37 @@ class TestSinglePoint(AttrRequirements, ExecutionRequirements):
         """Tests that no mutation does not modity chromosome"""
         assert original.chromosome == phenotype.chromosome
 
+    @mark.parametrize("mutation", [0.0], indirect=True)
+    def test_mutpb_000_zero_draws(self, mutation, original):
+        """Tests that no mutation happens even when all draws are 0.0"""
+        def zeros(*_args, out, **_kwds):
+            out.fill(0.0)
+        with mock.patch.object(random, "generator") as generator:
+            generator.random.side_effect = zeros
+            phenotype = mutation(original)
+        assert original.chromosome == phenotype.chromosome
+
     @mark.parametrize("mutation", [1.0], indirect=True)
     def test_mutpb_100(self, original, phenotype):
         """Tests that mutation does modity chromosome"""
         assert original.chromosome != phenotype.chromosome
+
+
+class TestNestedSinglePoint(AttrRequirements, ExecutionRequirements):
+    """Parametrization for 'SinglePoint' mutation on nested chromosomes"""
+
+    @fixture(scope="class")
+    def genotype(self):
+        """Parametrization to define a genotype with nested chromosomes"""
+        return examples.genotypes.Eucaryote
+
+    @fixture(scope="class")
+    def mutation(self):
+        """Parametrization to define the mutation method to use"""
+        return mutation.SinglePoint(mutpb=1.0)
+
+    def test_chromosomes(self, original, phenotype):
+        """Tests that mutation modifies the nested chromosomes"""
+        sets = zip(original.chromosomes, phenotype.chromosomes)
+        pairs = [(x, y) for set_o, set_p in sets for x, y in zip(set_o, set_p)]
+        assert any(x != y for x, y in pairs)
@@ -3,6 +3,7 @@
 # pylint: disable=unused-argument
 
 from inspect import ismethod
+from unittest import mock
 
 from pytest import fixture, mark, raises
 
@@ -50,6 +51,14 @@ class AttrRequirements:
         assert hasattr(session, "algorithm")
         assert isinstance(session.algorithm, Algorithm)
 
+    def test_assign_keeps_identity(self, session):
+        """Test assigned algorithm and fitness are not copied"""
+        algorithm = type(session.algorithm)()
+        fitness = type(session.fitness)()
+        session.algorithm, session.fitness = algorithm, fitness
+        assert session.algorithm is algorithm
+        assert session.fitness is fitness
+
 
 class ExecRequirements:
     """Tests group for session execution"""
@@ -66,6 +75,22 @@ class ExecRequirements:
         assert execution.best_score >= max_score
         assert execution.generation >= 0
 
+    @mark.parametrize("save_every, save_final, saves", [
+        (1, True, 5), (2, True, 3), (0, False, 0), (0, True, 1),
+    ])
+    def test_save_every(self, session, save_every, save_final, saves):
+        """Test population is saved each 'save_every' generations"""
+        container = type(session.database)
+        with mock.patch.object(
+            container, "add_phenotypes", autospec=True,
+            side_effect=container.add_phenotypes,
+        ) as add_phenotypes:
+            session.run(
+                max_generation=4,
+                save_every=save_every, save_final=save_final,
+            )
+        assert add_phenotypes.call_count == saves
+
     def test_attr_generation(self, execution):
         """Test generation attr returns int after first execution"""
         assert hasattr(execution, "generation")
@@ -85,6 +110,17 @@ class ErrRequirements:
         with raises(TypeError):
             session.run(unknown_kwarg="something", max_score=max_score)
 
+    def test_negative_save_every(self, session):
+        """Test negative save_every raises ValueError"""
+        with raises(ValueError):
+            session.run(max_generation=1, save_every=-1)
+
+    @mark.parametrize("save_every", [1.5, "2", None])
+    def test_save_every_type(self, session, save_every):
+        """Test non integer save_every raises TypeError"""
+        with raises(TypeError):
+            session.run(max_generation=1, save_every=save_every)
+
 
 # Parametrization ---------------------------------------------------
 class TestSessions(AttrRequirements, ExecRequirements, ErrRequirements):
@@ -107,3 +143,10 @@ class TestSessions(AttrRequirements, ExecRequirements, ErrRequirements):
         assert ismethod(session.reset_score)
         session.reset_score()
         assert all(x.score is None for x in session._population)
+
+    def test_eval_unscored(self, session):
+        """Test eval_phenotypes only scores phenotypes without score"""
+        session.run(max_generation=1)
+        scores = [x.score for x in session._population]
+        session.eval_phenotypes(session.fitness)
+        assert scores == [x.score for x in session._population]
@@ -0,0 +1,63 @@
+"""Module to test chromosome utilities for evolution algorithms."""
+# pylint: disable=redefined-outer-name
+
+from pytest import mark, raises
+
+from gevopy import genetics, random
+
+
+@mark.parametrize("chromosome, expected", [
+    (genetics.Haploid([0, 1, 1, 0]), [1, 0, 0, 1]),
+    (genetics.Diploid([0, 1, 2, 3]), [3, 2, 1, 0]),
+    (genetics.Triploid([0, 1, 6, 7]), [7, 6, 1, 0]),
+])
+def test_invert_chromosome(chromosome, expected):
+    """Tests chromosome inversion keeps type and values in states range"""
+    inverted = ~chromosome
+    assert isinstance(inverted, type(chromosome))
+    assert inverted.tolist() == expected
+
+
+@mark.parametrize("generator, chromosome_type", [
+    (random.haploid, genetics.Haploid),
+    (random.diploid, genetics.Diploid),
+    (random.triploid, genetics.Triploid),
+])
+def test_random_chromosome(generator, chromosome_type):
+    """Tests random chromosomes have the correct type and states range"""
+    chromosome = generator(100)
+    assert isinstance(chromosome, chromosome_type)
+    assert chromosome.dtype == "uint8"
+    assert chromosome.max() < chromosome_type.states
+
+
+@mark.parametrize("generator", [random.haploid, random.diploid])
+def test_seed_reproducible(generator):
+    """Tests seeding the generator reproduces the same chromosomes"""
+    random.seed(42)
+    chromosome_1 = generator(100)
+    random.seed(42)
+    chromosome_2 = generator(100)
+    assert chromosome_1.tolist() == chromosome_2.tolist()
+
+
+@mark.parametrize("chromosome", [genetics.Diploid([0, 1, 2, 1, 3])])
+def test_sequence_methods(chromosome):
+    """Tests sequence methods count and index on chromosome genes"""
+    assert chromosome.count(1) == 2
+    assert chromosome.index(1) == 1
+    assert chromosome.index(1, 2) == 3
+    with raises(ValueError):
+        chromosome.index(1, 4)
+
+
+@mark.parametrize("chromosome_1, chromosome_2, equal", [
+    (genetics.Haploid([0, 1, 1]), genetics.Haploid([0, 1, 1]), True),
+    (genetics.Haploid([0, 1, 1]), genetics.Haploid([0, 1, 0]), False),
+    (genetics.Haploid([0, 1, 1]), genetics.Haploid([0, 1]), False),
+    (genetics.Haploid([0, 1, 1]), [0, 1, 1], True),
+])
+def test_chromosome_equality(chromosome_1, chromosome_2, equal):
+    """Tests chromosome equality compares shape and genes"""
+    assert (chromosome_1 == chromosome_2) is equal
+    assert (chromosome_1 != chromosome_2) is (not equal)